@@ -9,5 +9,7 @@ DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 CHANNEL_ID = int(os.getenv("CHANNEL_ID", "1356375075208691937"))
 SPREADSHEET_ID = os.getenv("SPREADSHEET_ID", "1corGGS-H2WE_nhg5Sa80dHPpVcrl2jNzawxXxpniPDc")
 SCHEDULER_HOUR = os.getenv("SCHEDULER_HOUR", "10")
+HEALTH_HOST = os.getenv("HEALTH_HOST", "127.0.0.1")
+HEALTH_PORT = int(os.getenv("HEALTH_PORT", "8080"))
 AUTH_FILE = "auth.json"
 COMMAND_PREFIX = "."
\ No newline at end of file
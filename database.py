@@ -3,6 +3,9 @@ from contextlib import contextmanager
 from typing import List
 import logging
 import os
+import time
+
+from health_state import record_db_write
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -38,6 +41,12 @@ def init_db() -> None:
                     added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS health_probe (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
             conn.commit()
             logger.info("Database initialized successfully")
     except Exception as e:
@@ -77,8 +86,10 @@ def add_user(user_id: int) -> bool:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            started = time.perf_counter()
             cursor.execute("INSERT OR IGNORE INTO users (user_id) VALUES (?)", (user_id,))
             conn.commit()
+            record_db_write(time.perf_counter() - started)
             added = cursor.rowcount > 0
             if added:
                 logger.info(f"Added user {user_id} to database")
@@ -103,8 +114,10 @@ def remove_user(user_id: int) -> bool:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            started = time.perf_counter()
             cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
             conn.commit()
+            record_db_write(time.perf_counter() - started)
             removed = cursor.rowcount > 0
             if removed:
                 logger.info(f"Removed user {user_id} from database")
@@ -137,3 +150,24 @@ def user_exists(user_id: int) -> bool:
         logger.error(f"Error checking user {user_id}: {e}", exc_info=True)
         return False
 
+
+def probe_write() -> bool:
+    """
+    Perform a trivial write to check the database is writable.
+
+    Returns:
+        True if the write succeeded, False otherwise.
+    """
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            started = time.perf_counter()
+            cursor.execute(
+                "INSERT OR REPLACE INTO health_probe (id, checked_at) VALUES (1, CURRENT_TIMESTAMP)"
+            )
+            conn.commit()
+            record_db_write(time.perf_counter() - started)
+            return True
+    except Exception as e:
+        logger.error(f"Database write probe failed: {e}", exc_info=True)
+        return False
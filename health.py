@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import discord
+from aiohttp import web
+from apscheduler.schedulers.base import BaseScheduler
+
+from health_state import snapshot
+
+
+logger = logging.getLogger(__name__)
+
+# Gateway heartbeat latency (seconds) above which the bot is reported as not ready
+MAX_GATEWAY_LATENCY = 10.0
+# Seconds without a gateway event or heartbeat ACK before the gateway is considered stuck;
+# Discord heartbeats roughly every 41 seconds
+MAX_GATEWAY_SILENCE = 120.0
+# How often run_self_check probes Sheets and the database
+SELF_CHECK_INTERVAL_MINUTES = 5
+# A dependency is reported unhealthy once it has not succeeded for three self-check intervals
+MAX_SELF_CHECK_AGE = 3 * 60 * SELF_CHECK_INTERVAL_MINUTES
+
+
+def _age(timestamp: Optional[float], now: float) -> Optional[float]:
+    if timestamp is None:
+        return None
+    return round(now - timestamp, 3)
+
+
+def _heartbeat_ack_age(bot: discord.Client) -> Optional[float]:
+    """Age of the last heartbeat ACK, read from discord.py's keep-alive handler if available."""
+    keep_alive = getattr(getattr(bot, "ws", None), "_keep_alive", None)
+    last_ack = getattr(keep_alive, "_last_ack", None)
+    if last_ack is None:
+        return None
+    return round(time.perf_counter() - last_ack, 3)
+
+
+def build_report(bot: discord.Client, scheduler: Optional[BaseScheduler]) -> dict:
+    """
+    Build a health report from cached state only, without making any API calls.
+
+    Args:
+        bot: Discord bot client.
+        scheduler: The reminder scheduler, or None if not started yet.
+
+    Returns:
+        Dictionary with the report and an overall "ready" flag.
+    """
+    now = time.monotonic()
+    state = snapshot()
+
+    latency = bot.latency
+    gateway_latency = round(latency, 3) if math.isfinite(latency) else None
+    last_activity_age = _age(state["last_gateway_event"], now)
+    ack_age = _heartbeat_ack_age(bot)
+    if ack_age is not None and (last_activity_age is None or ack_age < last_activity_age):
+        last_activity_age = ack_age
+    gateway_ok = (
+        state["gateway_connected"]
+        and not bot.is_closed()
+        and last_activity_age is not None
+        and last_activity_age <= MAX_GATEWAY_SILENCE
+        and gateway_latency is not None
+        and gateway_latency <= MAX_GATEWAY_LATENCY
+    )
+
+    sheets_age = _age(state["last_sheet_success"], now)
+    sheets_ok = sheets_age is not None and sheets_age <= MAX_SELF_CHECK_AGE
+
+    db_latency = state["last_db_write_latency"]
+    db_age = _age(state["last_db_write_at"], now)
+    db_ok = db_age is not None and db_age <= MAX_SELF_CHECK_AGE
+
+    next_run_time = None
+    due_jobs = 0
+    scheduler_ok = scheduler is not None and scheduler.running
+    if scheduler is not None:
+        run_times = [job.next_run_time for job in scheduler.get_jobs() if job.next_run_time is not None]
+        if run_times:
+            next_run_time = min(run_times).isoformat()
+        wall_now = datetime.now(timezone.utc)
+        due_jobs = sum(1 for run_time in run_times if run_time <= wall_now)
+
+    return {
+        "ready": gateway_ok and sheets_ok and db_ok and scheduler_ok,
+        "gateway": {
+            "ok": gateway_ok,
+            "connected": state["gateway_connected"],
+            "latency_seconds": gateway_latency,
+            "last_activity_age_seconds": last_activity_age,
+            "guilds": len(bot.guilds),
+        },
+        "sheets": {
+            "ok": sheets_ok,
+            "last_success_age_seconds": sheets_age,
+            "last_failure_age_seconds": _age(state["last_sheet_failure"], now),
+            "last_worksheet_missing_age_seconds": _age(state["last_worksheet_missing"], now),
+        },
+        "database": {
+            "ok": db_ok,
+            "last_write_latency_ms": round(db_latency * 1000, 3) if db_latency is not None else None,
+            "last_write_age_seconds": db_age,
+        },
+        "scheduler": {
+            "ok": scheduler_ok,
+            "next_run_time": next_run_time,
+        },
+        "queues": {
+            "scheduler_due_jobs": due_jobs,
+            "reminders_in_flight": state["reminders_in_flight"],
+            "event_loop_tasks": len(asyncio.all_tasks()),
+        },
+    }
+
+
+async def run_self_check(check_sheets: Callable[[], bool], probe_database: Callable[[], bool]) -> None:
+    """
+    Probe Sheets and the database so the health report stays fresh without real traffic.
+
+    Both checks block, so they run in worker threads; they record their own results
+    into health_state.
+
+    Args:
+        check_sheets: Callable that opens the spreadsheet and returns whether it worked.
+        probe_database: Callable that performs a trivial write and returns whether it worked.
+    """
+    sheets_ok, database_ok = await asyncio.gather(
+        asyncio.to_thread(check_sheets),
+        asyncio.to_thread(probe_database),
+    )
+    logger.debug(f"Self-check finished - Sheets: {sheets_ok}, database: {database_ok}")
+
+
+async def start_health_server(
+    bot: discord.Client,
+    get_scheduler: Callable[[], Optional[BaseScheduler]],
+    host: str,
+    port: int,
+) -> web.AppRunner:
+    """
+    Start a local HTTP server exposing /health (liveness) and /ready (readiness).
+
+    Args:
+        bot: Discord bot client.
+        get_scheduler: Callable that returns the active scheduler, if any.
+        host: Interface to bind to.
+        port: Port to listen on.
+
+    Returns:
+        The aiohttp runner, so the caller can clean it up on shutdown.
+    """
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response(build_report(bot, get_scheduler()))
+
+    async def ready(request: web.Request) -> web.Response:
+        report = build_report(bot, get_scheduler())
+        return web.json_response(report, status=200 if report["ready"] else 503)
+
+    app = web.Application()
+    app.router.add_get("/health", health)
+    app.router.add_get("/ready", ready)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    logger.info(f"Health server listening on {host}:{port}")
+    return runner
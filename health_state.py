@@ -0,0 +1,55 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+# Cached runtime state read by health.py; timestamps are time.monotonic() values
+_state = {
+    "gateway_connected": False,
+    "last_gateway_event": None,
+    "last_sheet_success": None,
+    "last_sheet_failure": None,
+    "last_worksheet_missing": None,
+    "last_db_write_latency": None,
+    "last_db_write_at": None,
+    "reminders_in_flight": 0,
+}
+
+
+def snapshot() -> dict:
+    """Return a copy of the cached state."""
+    return dict(_state)
+
+
+def record_gateway_event(connected: bool = True) -> None:
+    """Record gateway activity, or a disconnect when connected is False."""
+    _state["gateway_connected"] = connected
+    if connected:
+        _state["last_gateway_event"] = time.monotonic()
+
+
+def record_sheet_fetch(success: bool) -> None:
+    """Record whether Google Sheets could be reached and authorized."""
+    key = "last_sheet_success" if success else "last_sheet_failure"
+    _state[key] = time.monotonic()
+
+
+def record_worksheet_missing() -> None:
+    """Record that Sheets was reachable but this week's worksheet does not exist."""
+    _state["last_worksheet_missing"] = time.monotonic()
+
+
+def record_db_write(duration: float) -> None:
+    """Record how long a successful database write took, in seconds."""
+    _state["last_db_write_latency"] = duration
+    _state["last_db_write_at"] = time.monotonic()
+
+
+@contextmanager
+def track_reminder() -> Iterator[None]:
+    """Count a reminder as in flight for the duration of the block."""
+    _state["reminders_in_flight"] += 1
+    try:
+        yield
+    finally:
+        _state["reminders_in_flight"] -= 1
@@ -0,0 +1,410 @@
+"""
+Local load test for the bot command handlers and send_reminder.
+
+Drives the handlers from register_commands and send_reminder with fake
+contexts, a fake gateway and a stub Sheets provider, against a scratch
+SQLite database. Nothing talks to Discord or Google.
+
+Example:
+    python loadtest.py --concurrency 50 --operations 2000 --channels 200
+"""
+import argparse
+import asyncio
+import calendar
+import logging
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger("loadtest")
+
+COMMAND_WEIGHTS = {"remind": 1, "list": 3, "add": 2, "remove": 2}
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, gateway_latency: float):
+        self.id = channel_id
+        self.name = f"channel-{channel_id}"
+        self._gateway_latency = gateway_latency
+        self.sent = 0
+
+    async def send(self, content: str) -> None:
+        await asyncio.sleep(self._gateway_latency)
+        self.sent += 1
+
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.name = f"user{user_id}"
+        self.discriminator = "0001"
+        self.mention = f"<@{user_id}>"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeContext:
+    def __init__(self, author: FakeUser, channel: FakeChannel):
+        self.author = author
+        self.channel = channel
+
+    async def send(self, content: str) -> None:
+        await self.channel.send(content)
+
+
+class FakeBot:
+    """Stands in for commands.Bot: collects registered commands and simulates the gateway."""
+
+    def __init__(self, gateway_latency: float, guild_count: int):
+        self.handlers: Dict[str, Callable[..., Awaitable[None]]] = {}
+        self.guilds = list(range(guild_count))
+        self._gateway_latency = gateway_latency
+        self._channels: Dict[int, FakeChannel] = {}
+
+    def command(self):
+        def decorator(func):
+            self.handlers[func.__name__] = func
+            return func
+
+        return decorator
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        if channel_id not in self._channels:
+            self._channels[channel_id] = FakeChannel(channel_id, self._gateway_latency)
+        return self._channels[channel_id]
+
+    async def fetch_user(self, user_id: int) -> FakeUser:
+        await asyncio.sleep(self._gateway_latency)
+        return FakeUser(user_id)
+
+
+class StubSpreadsheet:
+    def __init__(self, latency: float):
+        self._latency = latency
+
+    def fetch_sheet_metadata(self, params=None) -> dict:
+        time.sleep(self._latency)
+        return {"sheets": [{"data": [{"rowData": []}]}]}
+
+
+class StubWorksheet:
+    """
+    Mimics the gspread calls made by send_reminder.
+
+    Calls block for the configured latency, like the real synchronous
+    gspread client does, so their cost shows up as event loop blocking.
+    """
+
+    def __init__(self, latency: float):
+        self.title = "loadtest"
+        self.spreadsheet = StubSpreadsheet(latency)
+        self._latency = latency
+        self._days = [calendar.day_name[i] for i in range(7)]
+        self._times = ["", ""] + [f"Klokken {hour}-{hour + 1}" for hour in range(17, 22)]
+        self._bookings = ["", ""] + ["Træning", "Træning", "", "Officials", "Officials"]
+
+    def get(self, range_name: str) -> List[List[str]]:
+        time.sleep(self._latency)
+        return [list(self._days)]
+
+    def col_values(self, column: int) -> List[str]:
+        time.sleep(self._latency)
+        if column == 1:
+            return list(self._times)
+        return ["", self._days[column - 2]] + self._bookings[2:]
+
+
+class StubSheetProvider:
+    """
+    Stands in for sheets_service.get_sheet.
+
+    Blocks once per network round trip the real get_sheet makes (week number
+    lookup, token fetch, open_by_key, worksheet), and fails at the configured
+    rate the way get_sheet does, by returning None.
+    """
+
+    BLOCKING_CALLS = 4
+
+    def __init__(self, worksheet: StubWorksheet, latency: float, failure_rate: float, seed: int):
+        self._worksheet = worksheet
+        self._latency = latency
+        self._failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self.failures = 0
+
+    def __call__(self) -> Optional[StubWorksheet]:
+        for _ in range(self.BLOCKING_CALLS):
+            time.sleep(self._latency)
+        if self._rng.random() < self._failure_rate:
+            self.failures += 1
+            return None
+        return self._worksheet
+
+
+class LockCounter(logging.Handler):
+    """Counts database errors caused by SQLite lock contention."""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if "locked" in record.getMessage():
+            self.count += 1
+
+
+async def monitor_event_loop(stop: asyncio.Event, interval: float, lags: List[float]) -> None:
+    """Record how late each wake-up is; the lateness is time the loop was blocked."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+def hammer_database(database, stop: threading.Event, user_ids: List[int], seed: int) -> None:
+    """Background writer simulating another process sharing the SQLite file."""
+    rng = random.Random(seed)
+    while not stop.is_set():
+        user_id = rng.choice(user_ids)
+        if rng.random() < 0.5:
+            database.add_user(user_id)
+        else:
+            database.remove_user(user_id)
+
+
+def print_write_latencies(title: str, samples: List[float]) -> None:
+    print(f"{title}: {len(samples)}")
+    if samples:
+        print(
+            f"  latency p50: {statistics.median(samples) * 1000:.2f} ms, "
+            f"p99: {percentile(samples, 0.99) * 1000:.2f} ms, "
+            f"max: {max(samples) * 1000:.2f} ms"
+        )
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def print_latencies(title: str, latencies: Dict[str, List[float]], errors: Dict[str, int]) -> None:
+    print(f"\n{title}")
+    print(f"{'name':<10}{'count':>8}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name in sorted(latencies):
+        samples = latencies[name]
+        print(
+            f"{name:<10}{len(samples):>8}{errors.get(name, 0):>8}"
+            f"{percentile(samples, 0.50) * 1000:>10.1f}"
+            f"{percentile(samples, 0.95) * 1000:>10.1f}"
+            f"{percentile(samples, 0.99) * 1000:>10.1f}"
+            f"{max(samples, default=0.0) * 1000:>10.1f}"
+        )
+
+
+async def run(args: argparse.Namespace) -> None:
+    # Imported here so DB_DIR is set before database.py reads it.
+    import database
+    from bot_commands import register_commands
+    from reminder_service import send_reminder
+
+    database.init_db()
+
+    rng = random.Random(args.seed)
+    user_ids = [100_000 + index for index in range(args.users)]
+    for user_id in user_ids[: args.users // 2]:
+        database.add_user(user_id)
+
+    # Writes made by the handlers under test run on the event loop thread; keep the
+    # background writers' own writes apart so they don't skew the figures.
+    loop_thread_id = threading.get_ident()
+    db_write_latencies: List[float] = []
+    background_write_latencies: List[float] = []
+    record_db_write = database.record_db_write
+
+    def timed_record_db_write(duration: float) -> None:
+        if threading.get_ident() == loop_thread_id:
+            db_write_latencies.append(duration)
+        else:
+            background_write_latencies.append(duration)
+        record_db_write(duration)
+
+    database.record_db_write = timed_record_db_write
+
+    lock_counter = LockCounter()
+    logging.getLogger("database").addHandler(lock_counter)
+
+    gateway_latency = args.gateway_latency_ms / 1000
+    bot = FakeBot(gateway_latency, args.guilds)
+    sheets_latency = args.sheets_latency_ms / 1000
+    sheet_provider = StubSheetProvider(
+        StubWorksheet(sheets_latency), sheets_latency, args.sheets_failure_rate, args.seed
+    )
+    default_channel_id = 1
+
+    async def send_reminder_callback(channel_id: int | None = None) -> None:
+        await send_reminder(
+            bot=bot,
+            default_channel_id=default_channel_id,
+            get_sheet=sheet_provider,
+            channel_id=channel_id,
+        )
+
+    register_commands(bot, ".", send_reminder_callback)
+
+    operations = rng.choices(
+        list(COMMAND_WEIGHTS), weights=list(COMMAND_WEIGHTS.values()), k=args.operations
+    )
+    queue: asyncio.Queue = asyncio.Queue()
+    for name in operations:
+        queue.put_nowait(name)
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+
+    async def worker(worker_id: int) -> None:
+        worker_rng = random.Random(args.seed + worker_id)
+        while True:
+            try:
+                name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            author = FakeUser(worker_rng.choice(user_ids))
+            ctx = FakeContext(author, bot.get_channel(worker_rng.randint(1, args.channels)))
+            handler = bot.handlers[name]
+            started = time.perf_counter()
+            try:
+                if name in ("add", "remove"):
+                    await handler(ctx, FakeUser(worker_rng.choice(user_ids)))
+                else:
+                    await handler(ctx)
+            except Exception as e:
+                errors[name] += 1
+                logger.debug(f"{name} failed: {e}")
+            latencies[name].append(time.perf_counter() - started)
+
+    async def scheduled_reminder(channel_id: int) -> None:
+        started = time.perf_counter()
+        try:
+            await send_reminder_callback(channel_id)
+        except Exception as e:
+            errors["schedule"] += 1
+            logger.debug(f"Scheduled reminder for {channel_id} failed: {e}")
+        latencies["schedule"].append(time.perf_counter() - started)
+
+    stop_writers = threading.Event()
+    writers = [
+        threading.Thread(
+            target=hammer_database,
+            args=(database, stop_writers, user_ids, args.seed + 10_000 + index),
+            daemon=True,
+        )
+        for index in range(args.writer_threads)
+    ]
+    for writer in writers:
+        writer.start()
+
+    stop_monitor = asyncio.Event()
+    lags: List[float] = []
+    monitor = asyncio.create_task(monitor_event_loop(stop_monitor, args.monitor_interval_ms / 1000, lags))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(args.concurrency)))
+    commands_elapsed = time.perf_counter() - started
+
+    schedule_started = time.perf_counter()
+    await asyncio.gather(*(scheduled_reminder(channel_id) for channel_id in range(1, args.channels + 1)))
+    schedule_elapsed = time.perf_counter() - schedule_started
+
+    stop_monitor.set()
+    await monitor
+    stop_writers.set()
+    for writer in writers:
+        writer.join()
+
+    command_latencies = {name: samples for name, samples in latencies.items() if name != "schedule"}
+    command_count = sum(len(samples) for samples in command_latencies.values())
+
+    print(
+        f"Concurrency {args.concurrency}, {args.guilds} guild(s), {args.channels} channel(s), "
+        f"gateway {args.gateway_latency_ms} ms, sheets {args.sheets_latency_ms} ms, "
+        f"{args.writer_threads} writer thread(s), sheets failure rate {args.sheets_failure_rate}"
+    )
+    print_latencies("Commands", command_latencies, errors)
+    print(f"Throughput: {command_count / commands_elapsed:.1f} commands/s over {commands_elapsed:.2f} s")
+
+    print_latencies("Scheduled reminders", {"schedule": latencies["schedule"]}, errors)
+    print(f"Throughput: {args.channels / schedule_elapsed:.1f} reminders/s over {schedule_elapsed:.2f} s")
+    print(f"Sheets fetch failures: {sheet_provider.failures}")
+
+    total_elapsed = commands_elapsed + schedule_elapsed
+    blocked = sum(lags)
+    print("\nEvent loop")
+    print(f"Blocked: {blocked:.2f} s ({blocked / total_elapsed * 100:.1f}% of run)")
+    print(f"Lag p99: {percentile(lags, 0.99) * 1000:.1f} ms, max: {max(lags, default=0.0) * 1000:.1f} ms")
+
+    print("\nSQLite")
+    print_write_latencies("Command writes", db_write_latencies)
+    if args.writer_threads:
+        print_write_latencies("Background writes", background_write_latencies)
+    print(f"Lock errors: {lock_counter.count}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the bot command handlers and send_reminder.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent command workers.")
+    parser.add_argument("--operations", type=int, default=1000, help="Total commands to issue.")
+    parser.add_argument("--guilds", type=int, default=10, help="Guilds reported by the fake gateway.")
+    parser.add_argument("--channels", type=int, default=50, help="Channels, also the number of scheduled reminders.")
+    parser.add_argument("--users", type=int, default=200, help="Size of the user ID pool.")
+    parser.add_argument("--gateway-latency-ms", type=float, default=50.0, help="Simulated Discord round trip.")
+    parser.add_argument("--sheets-latency-ms", type=float, default=100.0, help="Simulated blocking Sheets call.")
+    parser.add_argument(
+        "--sheets-failure-rate", type=float, default=0.0, help="Fraction of Sheets fetches that fail (0-1)."
+    )
+    parser.add_argument("--writer-threads", type=int, default=0, help="Background threads writing to SQLite.")
+    parser.add_argument("--monitor-interval-ms", type=float, default=10.0, help="Event loop lag sampling interval.")
+    parser.add_argument("--db-dir", help="Empty database directory (defaults to a temporary directory).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--verbose", action="store_true", help="Show bot log output.")
+    args = parser.parse_args()
+
+    for name in ("concurrency", "operations", "channels", "users"):
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name} must be positive")
+    if not 0.0 <= args.sheets_failure_rate <= 1.0:
+        parser.error("--sheets-failure-rate must be between 0 and 1")
+    # The harness seeds and churns fake users; never let it touch a real reminder list.
+    if args.db_dir and os.path.exists(os.path.join(args.db_dir, "reminder.db")):
+        parser.error(f"{args.db_dir} already contains reminder.db; point --db-dir at an empty directory")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # Keep records flowing so LockCounter sees database errors; only the console output is filtered.
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO if args.verbose else logging.CRITICAL)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=[console],
+    )
+
+    with tempfile.TemporaryDirectory(prefix="praccreminder-load-") as scratch_dir:
+        os.environ["DB_DIR"] = args.db_dir or scratch_dir
+        asyncio.run(run(args))
@@ -2,14 +2,29 @@ import discord
 from discord.ext import commands
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from aiohttp import web
+from datetime import datetime, timezone
 from functools import partial
+import asyncio
 import logging
 
 from bot_commands import register_commands
-from config import AUTH_FILE, CHANNEL_ID, COMMAND_PREFIX, DISCORD_TOKEN, SCHEDULER_HOUR, SPREADSHEET_ID
-from database import init_db
+from config import (
+    AUTH_FILE,
+    CHANNEL_ID,
+    COMMAND_PREFIX,
+    DISCORD_TOKEN,
+    HEALTH_HOST,
+    HEALTH_PORT,
+    SCHEDULER_HOUR,
+    SPREADSHEET_ID,
+)
+from database import init_db, probe_write
+from health import SELF_CHECK_INTERVAL_MINUTES, run_self_check, start_health_server
+from health_state import record_gateway_event, track_reminder
 from reminder_service import send_reminder
-from sheets_service import get_sheet
+from sheets_service import check_sheets_access, get_sheet
 
 # Setup logging with more detailed format
 logging.basicConfig(
@@ -36,10 +51,44 @@ init_db()
 logger.info("Database initialized")
 
 sheet_provider = partial(get_sheet, AUTH_FILE, SPREADSHEET_ID)
+sheets_check = partial(check_sheets_access, AUTH_FILE, SPREADSHEET_ID)
+scheduler: AsyncIOScheduler | None = None
+health_runner: web.AppRunner | None = None
 
 
 async def send_reminder_for_channel(channel_id: int | None = None) -> None:
-    await send_reminder(bot=bot, default_channel_id=CHANNEL_ID, get_sheet=sheet_provider, channel_id=channel_id)
+    with track_reminder():
+        await send_reminder(bot=bot, default_channel_id=CHANNEL_ID, get_sheet=sheet_provider, channel_id=channel_id)
+
+
+@bot.event
+async def setup_hook():
+    """Called once before the bot connects to the gateway."""
+    global health_runner
+    try:
+        health_runner = await start_health_server(bot, lambda: scheduler, HEALTH_HOST, HEALTH_PORT)
+    except OSError as e:
+        logger.error(f"Could not start health server on {HEALTH_HOST}:{HEALTH_PORT}, continuing without it: {e}")
+
+
+@bot.event
+async def on_connect():
+    """Called when the gateway connection is established."""
+    record_gateway_event()
+
+
+@bot.event
+async def on_resumed():
+    """Called when a dropped gateway session is resumed."""
+    logger.info("Gateway session resumed")
+    record_gateway_event()
+
+
+@bot.event
+async def on_disconnect():
+    """Called when the gateway connection is lost."""
+    logger.warning("Disconnected from gateway")
+    record_gateway_event(connected=False)
 
 
 @bot.event
@@ -47,12 +96,24 @@ async def on_ready():
     """Called when the bot is ready."""
     logger.info(f"Bot logged in as {bot.user} (ID: {bot.user.id})")
     logger.info(f"Connected to {len(bot.guilds)} guild(s)")
+    record_gateway_event()
     
-    # Start scheduler when bot is ready
+    # Start scheduler when bot is ready; on_ready fires again after reconnects
+    global scheduler
+    if scheduler is not None:
+        return
+
     scheduler = AsyncIOScheduler()
     scheduler.add_job(send_reminder_for_channel, CronTrigger(hour=SCHEDULER_HOUR))
+    scheduler.add_job(
+        run_self_check,
+        IntervalTrigger(minutes=SELF_CHECK_INTERVAL_MINUTES),
+        args=[sheets_check, probe_write],
+        next_run_time=datetime.now(timezone.utc),
+    )
     scheduler.start()
     logger.info(f"Scheduler started - daily reminders at {SCHEDULER_HOUR}:00")
+    logger.info(f"Self-check runs every {SELF_CHECK_INTERVAL_MINUTES} minute(s)")
 
 
 @bot.event
@@ -72,6 +133,16 @@ async def on_command_error(ctx, error):
         await ctx.send("Der opstod en fejl ved udførelse af kommandoen.")
 register_commands(bot, COMMAND_PREFIX, send_reminder_for_channel)
 
+
+async def run_bot() -> None:
+    """Run the bot until it stops, then shut down the health server."""
+    try:
+        async with bot:
+            await bot.start(DISCORD_TOKEN)
+    finally:
+        if health_runner is not None:
+            await health_runner.cleanup()
+
 if __name__ == "__main__":
     logger.info("=== Starting PraccReminder Bot ===")
     
@@ -82,7 +153,9 @@ if __name__ == "__main__":
     logger.info("Starting Discord connection...")
     logger.info(f"Using Spreadsheet ID: {SPREADSHEET_ID}")
     try:
-        bot.run(DISCORD_TOKEN)
+        asyncio.run(run_bot())
+    except KeyboardInterrupt:
+        logger.info("Shutting down")
     except discord.LoginFailure:
         logger.critical("Failed to login - Invalid Discord token")
         exit(1)
@@ -5,11 +5,49 @@ import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 
 import week
+from health_state import record_sheet_fetch, record_worksheet_missing
 
 
 logger = logging.getLogger(__name__)
 
 
+def _open_spreadsheet(auth_file: str, spreadsheet_id: str) -> gspread.Spreadsheet:
+    """Authorize with the service account and open the spreadsheet."""
+    scope = [
+        "https://spreadsheets.google.com/feeds",
+        "https://www.googleapis.com/auth/drive",
+    ]
+    creds = ServiceAccountCredentials.from_json_keyfile_name(auth_file, scope)
+    client = gspread.authorize(creds)
+    logger.debug("Authorized with Google Sheets API")
+
+    spreadsheet = client.open_by_key(spreadsheet_id)
+    logger.debug(f"Opened spreadsheet: {spreadsheet_id}")
+    return spreadsheet
+
+
+def check_sheets_access(auth_file: str, spreadsheet_id: str) -> bool:
+    """
+    Check that the credentials still work and the spreadsheet can be opened.
+
+    Returns:
+        True if the spreadsheet could be opened, False otherwise.
+    """
+    try:
+        _open_spreadsheet(auth_file, spreadsheet_id)
+    except FileNotFoundError:
+        logger.error(f"Sheets self-check failed: auth file '{auth_file}' not found")
+        record_sheet_fetch(success=False)
+        return False
+    except Exception as e:
+        logger.error(f"Sheets self-check failed: {e}")
+        record_sheet_fetch(success=False)
+        return False
+
+    record_sheet_fetch(success=True)
+    return True
+
+
 def get_sheet(auth_file: str, spreadsheet_id: str) -> Optional[gspread.Worksheet]:
     """
     Get the worksheet for the current week.
@@ -20,22 +58,14 @@ def get_sheet(auth_file: str, spreadsheet_id: str) -> Optional[gspread.Worksheet
     logger.debug("Attempting to access Google Sheets")
     spreadsheet = None
     try:
-        scope = [
-            "https://spreadsheets.google.com/feeds",
-            "https://www.googleapis.com/auth/drive",
-        ]
-        creds = ServiceAccountCredentials.from_json_keyfile_name(auth_file, scope)
-        client = gspread.authorize(creds)
-        logger.debug("Authorized with Google Sheets API")
-
-        spreadsheet = client.open_by_key(spreadsheet_id)
-        logger.debug(f"Opened spreadsheet: {spreadsheet_id}")
+        spreadsheet = _open_spreadsheet(auth_file, spreadsheet_id)
 
         week_name = week.get_week()
         logger.info(f"Looking for worksheet: '{week_name}'")
 
         worksheet = spreadsheet.worksheet(week_name)
         logger.info(f"Successfully found worksheet: '{week_name}'")
+        record_sheet_fetch(success=True)
         return worksheet
 
     except gspread.exceptions.WorksheetNotFound:
@@ -45,10 +75,15 @@ def get_sheet(auth_file: str, spreadsheet_id: str) -> Optional[gspread.Worksheet
             worksheets = spreadsheet.worksheets()
             available = [ws.title for ws in worksheets]
             logger.info(f"Available worksheets: {available}")
+        # Sheets itself was reachable; a missing tab is a data problem, not an outage
+        record_sheet_fetch(success=True)
+        record_worksheet_missing()
         return None
     except FileNotFoundError:
         logger.error(f"Auth file '{auth_file}' not found")
+        record_sheet_fetch(success=False)
         return None
     except Exception as e:
         logger.error(f"Error accessing spreadsheet: {e}", exc_info=True)
+        record_sheet_fetch(success=False)
         return None
\ No newline at end of file